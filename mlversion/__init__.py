@@ -1,13 +1,21 @@
+from importlib import import_module
+
 from mlversion._version import __version__
-from mlversion._version_handler import ModelVersion
-from mlversion._version_handler import VersionHandler
-from mlversion._artifacts import CSVArtifact
-from mlversion._artifacts import ParquetArtifact
-from mlversion._artifacts import BinaryArtifact
-from mlversion._artifact_handler import Artifact
-from mlversion._artifact_handler import ArtifactSubGroup
-from mlversion._artifact_handler import ArtifactGroup
-from mlversion._artifact_handler import ArtifactHandler
+
+
+# Public classes are imported on first access (PEP 562), so that `import mlversion` does not pull pandas, pyarrow and
+# the other heavy dependencies of the artifact modules until they are actually used.
+_LAZY_ATTRIBUTES = {
+    "ModelVersion": "mlversion._version_handler",
+    "VersionHandler": "mlversion._version_handler",
+    "CSVArtifact": "mlversion._artifacts",
+    "ParquetArtifact": "mlversion._artifacts",
+    "BinaryArtifact": "mlversion._artifacts",
+    "Artifact": "mlversion._artifacts",
+    "ArtifactSubGroup": "mlversion._artifact_handler",
+    "ArtifactGroup": "mlversion._artifact_handler",
+    "ArtifactHandler": "mlversion._artifact_handler",
+}
 
 
 __all__ = [
@@ -22,3 +30,16 @@ __all__ = [
     "ArtifactGroup",
     "ArtifactHandler",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,64 @@
+import copy
+import functools
+import itertools
 import os
-from typing import List, Optional
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, List, Optional, Tuple
 from loguru import logger
-from distutils.dir_util import copy_tree
 
-from pydantic import Field
-from pydantic.fields import FieldInfo
-from pydantic.dataclasses import dataclass
 from basix import files
 
-from mlversion import VersionHandler
-from mlversion._artifacts import Artifact, ARTIFACT_TYPES, load_artifact
-from mlversion._utils import get_dirname
+from mlversion._version_handler import VersionHandler
+from mlversion._artifacts import Artifact, ARTIFACT_TYPES, forget_artifacts, load_artifact, load_pending_artifacts
+from mlversion._utils import DATACLASS_OPTIONS, link_or_copy
 from mlversion.errors import ExistingAttributeError, IncompatibleArgumentsError
 
 
-@dataclass
+def _get_workers_setting(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise ValueError(f"The environment variable {name} must be an integer, got {value!r}.") from None
+
+
+MAX_SAVE_WORKERS = 8
+MAX_LOAD_WORKERS = _get_workers_setting("MLVERSION_LOAD_WORKERS", 8)
+
+
+def _map_threaded(function, items, max_workers: int) -> list:
+    # Saving and loading are dominated by file I/O, which pandas, pyarrow and joblib perform without holding the GIL.
+    items = list(items)
+    if len(items) < 2 or max_workers <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(function, items))
+
+
+def _save_all(items) -> None:
+    _map_threaded(lambda item: item.save(), items, MAX_SAVE_WORKERS)
+
+
+def _validate_label(label: str) -> None:
+    # Members are accessed as attributes, e.g. `subgroup.X_train`, so their labels must be valid identifiers.
+    if not isinstance(label, str) or not label.isidentifier():
+        raise ValueError(f"Invalid label {label!r}: labels must be valid Python identifiers.")
+
+
+def _is_reserved_label(container, label: str) -> bool:
+    # Field names are only class attributes when the dataclass is slotted (Python 3.10+), so they are checked as well.
+    return hasattr(container.__class__, label) or label in {f.name for f in fields(container)}
+
+
+def _load_all(entries, lazy: bool) -> List[Artifact]:
+    return _map_threaded(functools.partial(load_artifact, lazy=lazy), entries, MAX_LOAD_WORKERS)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ArtifactSubGroup:
     """
     A group of artifacts that share a parent directory.
@@ -40,8 +84,9 @@ class ArtifactSubGroup:
     path : Optional[str]
         The path of the directory containing the artifacts. If not provided, it is constructed using the parent
         directory and the subgroup label.
-    artifacts : List[Artifact]
-        The list of artifacts in the subgroup.
+    artifacts : ValuesView[Artifact]
+        A live view over the artifacts in the subgroup, in insertion order. The artifacts themselves are stored in a
+        dictionary keyed by label.
 
     Methods
     -------
@@ -68,50 +113,67 @@ class ArtifactSubGroup:
         Raised when trying to create or add an artifact with a label that already exists in the subgroup.
     TypeError
         Raised when trying to add an object that is not an Artifact to the subgroup.
-    IncompatibleArgumentsError
-        Raised when trying to create an artifact with both an Artifact object and label/content/type arguments.
+    ValueError
+        Raised when trying to create or add an artifact whose label is not a valid Python identifier.
 
     """
 
     label: str
     parent_dir: str
     path: Optional[str] = None
-    artifacts: List[Artifact] = Field(default_factory=list)
+    artifacts: List[Artifact] = field(default_factory=list, compare=False, repr=False)
+    _artifacts: Dict[str, Artifact] = field(default_factory=dict, init=False)
 
     def __post_init__(self):
         """
         Post-initialization step that sets the path of the subgroup and updates the list of artifacts.
         """
+        self._artifacts = {artifact.label: artifact for artifact in self.artifacts}
+        self.artifacts = self._artifacts.values()
         self.set_path(self.parent_dir, self.label)
         self.update()
 
-    class Config:
+    def __getattr__(self, name: str) -> Artifact:
         """
-        Pydantic configuration.
+        Gives access to the artifacts of the subgroup as attributes, e.g. `subgroup.X_train`.
         """
+        try:
+            return object.__getattribute__(self, "_artifacts")[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(object.__dir__(self)) | set(self._artifacts))
 
-        arbitrary_types_allowed = True
+    def __reduce__(self):
+        return (self.__class__, (self.label, self.parent_dir, self.path, list(self._artifacts.values())))
 
     def save(self) -> "ArtifactSubGroup":
         """
         Saves all artifacts in the subgroup.
 
+        The artifacts are written concurrently by a pool of up to `MAX_SAVE_WORKERS` threads. The first error raised
+        by an artifact is propagated.
+
         Returns
         -------
         ArtifactSubGroup
             The updated subgroup.
         """
-        if not isinstance(self.artifacts, FieldInfo):
-            for artifact in self.artifacts:
-                artifact.save()
+        if self._artifacts:
+            os.makedirs(self.path, exist_ok=True)
+            _save_all(self.artifacts)
 
         return self
 
     @classmethod
-    def load(cls, label: str, parent_dir: str) -> "ArtifactSubGroup":
+    def load(cls, label: str, parent_dir: str, lazy: bool = True) -> "ArtifactSubGroup":
         """
         Loads an `ArtifactSubGroup` object from a directory.
 
+        The artifacts are read concurrently by a pool of up to `MAX_LOAD_WORKERS` threads and added to the subgroup
+        in a single batch.
+
         Parameters
         ----------
         cls : type
@@ -120,18 +182,26 @@ class ArtifactSubGroup:
             The label of the subgroup.
         parent_dir : str
             The path to the parent directory of the subgroup.
+        lazy : bool, optional
+            Whether to defer reading the content of each artifact until it is first accessed (default is True). Only
+            the metadata of the artifacts is read here. Lazily loaded artifacts that are saved back to the same place
+            without their content being accessed are not rewritten.
 
         Returns
         -------
         ArtifactSubGroup
-            The `ArtifactSubGroup` object.
+            The `ArtifactSubGroup` object. It is empty if the subgroup directory does not exist, as is the case for a
+            subgroup that never had artifacts saved.
         """
         subgroup = ArtifactSubGroup(label=label, parent_dir=parent_dir)
         path = os.path.join(parent_dir, label)
-        for label in os.listdir(path):
-            artifact_path = os.path.join(path, label)
-            artifact = load_artifact(artifact_path)
-            subgroup.add_artifact(artifact)
+        try:
+            entries = os.scandir(path)
+        except FileNotFoundError:
+            return subgroup
+        with entries:
+            artifacts = _load_all(entries, lazy)
+        subgroup._add_artifacts(artifacts)
         return subgroup
 
     def create_artifact(self, label: str, content: bytes, type: str, overwrite: bool = False) -> "ArtifactSubGroup":
@@ -157,9 +227,8 @@ class ArtifactSubGroup:
             The current object.
         """
 
-        if hasattr(self, label) and not overwrite:
-            raise ExistingAttributeError(self, label)
-        artifact = self._set_artifact_to_be_added(label=label, content=content, type=type)
+        self._check_label(label, overwrite)
+        artifact = self._build_artifact(label=label, content=content, type=type)
         self._add_artifact(artifact)
         return self
 
@@ -182,9 +251,8 @@ class ArtifactSubGroup:
             The current object.
         """
         if isinstance(artifact, Artifact):
-            if hasattr(self, artifact.label) and not overwrite:
-                raise ExistingAttributeError(self, artifact.label)
-            artifact = self._set_artifact_to_be_added(artifact=artifact)
+            self._check_label(artifact.label, overwrite)
+            artifact = self._rebind_artifact(artifact)
             self._add_artifact(artifact)
 
         else:
@@ -209,7 +277,6 @@ class ArtifactSubGroup:
         ArtifactSubGroup
             The same object of the class 'ArtifactSubGroup', but with the artifact removed.
         """
-        self._remove_artifact_attribute(label)
         self._remove_artifact_from_list(label)
         self._remove_artifact_dir(label)
         return self
@@ -220,9 +287,10 @@ class ArtifactSubGroup:
 
         This method should be called whenever the parent directory or label of the ArtifactSubGroup changes.
         """
-        new_parent_dir = os.path.join(self.parent_dir, self.label)
+        new_parent_dir = self.path
         for art in self.artifacts:
-            art.set_path(new_parent_dir, art.label)
+            if art.parent_dir != new_parent_dir:
+                art.set_path(new_parent_dir, art.label)
         return self
 
     def set_path(self, parent_dir: str, label: str) -> None:
@@ -246,62 +314,68 @@ class ArtifactSubGroup:
         """
         Update the `ArtifactSubGroup` object after modifying its artifacts list.
 
-        This method should be called every time the artifacts list is modified, in order to ensure that the object
-        has consistent state. It removes any artifact attribute that is no longer present in the artifacts list, and
-        sets the path of the artifacts to the current subgroup path.
+        Artifacts are looked up by label on attribute access, so the only state to keep consistent is the path of the
+        artifacts, which is set to the current subgroup path. Adding or removing a single artifact keeps the object
+        consistent on its own, so a full update is only needed after bulk changes or when the subgroup path changes.
 
         Returns
         -------
         None
         """
-        if not isinstance(self.artifacts, FieldInfo):
-            for elem in self.artifacts:
-                self._remove_artifact_attribute(elem.label)
-                setattr(self, elem.label, elem)
-
-            self.update_artifacts_paths()
+        self.update_artifacts_paths()
 
-    def _add_artifact(self, artifact):
-        self.artifacts.append(artifact)
-        self.update()
+    @classmethod
+    def _from_prepared(cls, label: str, parent_dir: str, artifacts: Iterable[Artifact]) -> "ArtifactSubGroup":
+        # Builds a subgroup from artifacts whose paths already point inside it, skipping the path update done by
+        # `__post_init__`.
+        subgroup = cls.__new__(cls)
+        subgroup.label = label
+        subgroup.parent_dir = parent_dir
+        subgroup._artifacts = {artifact.label: artifact for artifact in artifacts}
+        subgroup.artifacts = subgroup._artifacts.values()
+        subgroup.set_path(parent_dir, label)
+        return subgroup
 
-    def _set_artifact_to_be_added(self, artifact=None, label=None, content=None, type=None):
-        artifact_passed = artifact is not None
-        label_passed = label is not None
-        content_passed = content is not None
-        type_passed = type is not None
-        new_parent_dir = self.path
+    def _check_label(self, label: str, overwrite: bool) -> None:
+        # Labels that name a class attribute (e.g. "save") would be shadowed on attribute access, so they are
+        # rejected even when overwriting.
+        _validate_label(label)
+        if _is_reserved_label(self, label) or (label in self._artifacts and not overwrite):
+            raise ExistingAttributeError(self, label)
 
-        if artifact_passed and (not label_passed) and (not content_passed) and (not type_passed):
-            label = artifact.label
-            content = artifact.content
-            type = artifact.type
+    def _add_artifact(self, artifact):
+        self._artifacts[artifact.label] = artifact
 
-        if artifact_passed and (label_passed or content_passed or type_passed):
-            raise IncompatibleArgumentsError("If you pass and artifact, you cannot pass label and content")
+    def _add_artifacts(self, artifacts: Iterable[Artifact]) -> None:
+        for artifact in artifacts:
+            self._artifacts[artifact.label] = artifact
+        self.update()
 
+    def _build_artifact(self, label: str, content, type: str) -> Artifact:
         ArtifactClass = ARTIFACT_TYPES[type]
+        return ArtifactClass(label=label, content=content, parent_dir=self.path)
 
-        return ArtifactClass(
-            label=label,
-            content=content,
-            parent_dir=new_parent_dir,
-        )
-
-    def _remove_artifact_attribute(self, label: str) -> None:
-        if hasattr(self, label):
-            delattr(self, label)
+    def _rebind_artifact(self, artifact: Artifact) -> Artifact:
+        # Artifacts loaded from this subgroup already point inside it and are reused as they are. Others are
+        # shallow-copied before being moved, so the artifact keeps its path in any subgroup it already belongs to.
+        if artifact.parent_dir == self.path:
+            return artifact
+        artifact = copy.copy(artifact)
+        artifact.set_path(self.path, artifact.label)
+        return artifact
 
     def _remove_artifact_from_list(self, label: str) -> None:
-        self.artifacts = [elem for elem in self.artifacts if elem.label != label]
+        self._artifacts.pop(label, None)
 
     def _remove_artifact_dir(self, label: str):
         directory = os.path.join(self.path, label)
         logger.warning(f"Removing folder {directory}")
+        load_pending_artifacts(directory)
         files.remove_directory(directory, recursive=True)
+        forget_artifacts(directory)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ArtifactGroup:
     """
     A class that represents a group of artifacts.
@@ -314,8 +388,12 @@ class ArtifactGroup:
         The path of the directory that contains the artifact group.
     path : Optional[str], default=None
         The path of the artifact group directory.
-    subgroups : List[ArtifactSubGroup], default_factory=list
-        A list containing the subgroups of the artifact group.
+    subgroups : ValuesView[ArtifactSubGroup]
+        A live view over the subgroups of the artifact group, in insertion order. The constructor accepts a list of
+        subgroups; they are stored in a dictionary keyed by label and are also accessible as attributes.
+    default_subgroups : Tuple[str, ...], default=()
+        Labels of empty subgroups that are created on first attribute access, e.g. `group.raw`, instead of when the
+        group is created. Until then they are not listed in `subgroups`.
 
     Methods
     -------
@@ -338,7 +416,9 @@ class ArtifactGroup:
     label: str
     parent_dir: str
     path: Optional[str] = None
-    subgroups: List[ArtifactSubGroup] = Field(default_factory=list)
+    subgroups: List[ArtifactSubGroup] = field(default_factory=list, compare=False, repr=False)
+    default_subgroups: Tuple[str, ...] = field(default=(), repr=False)
+    _subgroups: Dict[str, ArtifactSubGroup] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
         """
@@ -349,29 +429,49 @@ class ArtifactGroup:
         self : ArtifactGroup
             The artifact group to initialize.
         """
+        self._subgroups = {subgroup.label: subgroup for subgroup in self.subgroups}
+        self.subgroups = self._subgroups.values()
         self.set_path(self.parent_dir, self.label)
-        self.update()
 
-    class Config:
-        arbitrary_types_allowed = True
+    def __getattr__(self, name: str) -> ArtifactSubGroup:
+        """
+        Gives access to the subgroups of the group as attributes, e.g. `group.raw`. Default subgroups are created
+        here the first time they are accessed.
+        """
+        try:
+            subgroups = object.__getattribute__(self, "_subgroups")
+            if name not in subgroups and name in object.__getattribute__(self, "default_subgroups"):
+                subgroups[name] = ArtifactSubGroup(label=name, parent_dir=self.path)
+            return subgroups[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(object.__dir__(self)) | set(self._subgroups) | set(self.default_subgroups))
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.label, self.parent_dir, self.path, list(self._subgroups.values()), self.default_subgroups),
+        )
 
     def save(self) -> "ArtifactGroup":
         """
         Saves the artifacts of the artifact group to disk.
 
+        The artifacts of all subgroups are written concurrently by a single pool of up to `MAX_SAVE_WORKERS` threads.
+
         Returns
         -------
         ArtifactGroup
             The artifact group that was saved.
         """
-        if not isinstance(self.subgroups, FieldInfo):
-            for subgroup in self.subgroups:
-                subgroup.save()
+        _save_all(artifact for subgroup in self.subgroups for artifact in subgroup.artifacts)
 
         return self
 
     @classmethod
-    def load(cls, label: str, parent_dir: str) -> "ArtifactGroup":
+    def load(cls, label: str, parent_dir: str, lazy: bool = True) -> "ArtifactGroup":
         """
         Loads an artifact group from disk.
 
@@ -381,18 +481,34 @@ class ArtifactGroup:
             The name of the artifact group.
         parent_dir : str
             The path of the directory that contains the artifact group.
+        lazy : bool, optional
+            Whether to defer reading the content of each artifact until it is first accessed (default is True).
 
         Returns
         -------
         ArtifactGroup
-            The artifact group that was loaded.
+            The artifact group that was loaded. It is empty if the group directory does not exist.
+
+        Notes
+        -----
+        The subgroup directories are listed first, and the artifacts of all subgroups are then read concurrently by a
+        single pool of up to `MAX_LOAD_WORKERS` threads.
         """
         group = ArtifactGroup(label=label, parent_dir=parent_dir)
         path = os.path.join(parent_dir, label)
-        for label in os.listdir(path):
-            subgroup_path = os.path.join(path, label)
-            subgroup = cls._load_subgroup(subgroup_path)
-            group.add_subgroup(subgroup)
+        try:
+            entries = os.scandir(path)
+        except FileNotFoundError:
+            return group
+        with entries:
+            scanned = [cls._scan_subgroup(path, entry) for entry in entries]
+
+        # The artifacts of all subgroups are loaded by a single pool rather than by one pool per subgroup.
+        artifacts = iter(_load_all([entry for _, entries in scanned for entry in entries], lazy))
+        for subgroup, entries in scanned:
+            subgroup._add_artifacts(itertools.islice(artifacts, len(entries)))
+
+        group._add_subgroups(subgroup for subgroup, _ in scanned)
         return group
 
     def add_subgroup(self, subgroup: ArtifactSubGroup, overwrite=False) -> "ArtifactGroup":
@@ -415,8 +531,7 @@ class ArtifactGroup:
         """
         pass
         if isinstance(subgroup, ArtifactSubGroup):
-            if hasattr(self, subgroup.label) and not overwrite:
-                raise ExistingAttributeError(self, subgroup.label)
+            self._check_label(subgroup.label, overwrite)
             subgroup = self._set_subgroup_to_be_added(subgroup=subgroup)
             self._add_subgroup(subgroup)
 
@@ -442,7 +557,6 @@ class ArtifactGroup:
             The ArtifactGroup instance.
 
         """
-        self._remove_subgroup_attribute(label)
         self._remove_subgroup_from_list(label)
         return self
 
@@ -467,24 +581,18 @@ class ArtifactGroup:
     def update(self) -> None:
         """Updates the ArtifactGroup instance.
 
-        This method removes any subgroup attributes that do not exist in the subgroups list
-        and adds any new subgroups that exist in the subgroups list but do not have an attribute yet.
+        Subgroups are looked up by label on attribute access. This method re-indexes them by their current label,
+        which is only needed if the label of a subgroup was changed after it was added.
 
         Returns
         -------
         None
         """
-        if not isinstance(self.subgroups, FieldInfo):
-            for elem in self.subgroups:
-                self._remove_subgroup_attribute(elem.label)
-                setattr(self, elem.label, elem)
-
-    def _remove_subgroup_attribute(self, label: str) -> None:
-        if hasattr(self, label):
-            delattr(self, label)
+        self._subgroups = {elem.label: elem for elem in self._subgroups.values()}
+        self.subgroups = self._subgroups.values()
 
     def _remove_subgroup_from_list(self, label: str) -> None:
-        self.subgroups = [elem for elem in self.subgroups if elem.label != label]
+        self._subgroups.pop(label, None)
 
     def _set_subgroup_to_be_added(self, subgroup=None, label=None, artifacts=None):
         subgroup_passed = subgroup is not None
@@ -499,27 +607,40 @@ class ArtifactGroup:
         if subgroup_passed and (label_passed or artifacts_passed):
             raise IncompatibleArgumentsError("If you pass and subgroup, you cannot pass the artifacts")
 
+        # A subgroup that already lives in this group is added as it is. Otherwise the artifacts are moved into a new
+        # subgroup as shallow copies, so that the subgroup they came from keeps its paths.
+        if subgroup_passed and subgroup.parent_dir == new_parent_dir:
+            return subgroup
+
+        subgroup_path = os.path.join(new_parent_dir, label)
+        prepared = []
         for art in artifacts:
-            art.set_path(os.path.join(new_parent_dir, label), art.label)
+            if art.parent_dir != subgroup_path:
+                art = copy.copy(art)
+                art.set_path(subgroup_path, art.label)
+            prepared.append(art)
 
-        return ArtifactSubGroup(
-            label=label,
-            parent_dir=new_parent_dir,
-            artifacts=artifacts,
-        )
+        return ArtifactSubGroup._from_prepared(label=label, parent_dir=new_parent_dir, artifacts=prepared)
+
+    def _check_label(self, label: str, overwrite: bool) -> None:
+        _validate_label(label)
+        if _is_reserved_label(self, label) or (label in self._subgroups and not overwrite):
+            raise ExistingAttributeError(self, label)
 
     def _add_subgroup(self, subgroup):
-        self.subgroups.append(subgroup)
-        self.update()
+        self._subgroups[subgroup.label] = subgroup
+
+    def _add_subgroups(self, subgroups: Iterable[ArtifactSubGroup]) -> None:
+        for subgroup in subgroups:
+            self._subgroups[subgroup.label] = subgroup
 
     @classmethod
-    def _load_subgroup(cls, subgroup_path: str):
-        if not os.path.isdir(subgroup_path):
-            raise NotADirectoryError("'{subgroup_path}' is not a valid artifact path")
-        parent_dir = os.path.dirname(subgroup_path)
-        label = get_dirname(subgroup_path)
-        subgroup = ArtifactSubGroup.load(label, parent_dir)
-        return subgroup
+    def _scan_subgroup(cls, parent_dir: str, entry: os.DirEntry):
+        if not entry.is_dir():
+            raise NotADirectoryError(f"'{entry.path}' is not a valid artifact path")
+        subgroup = ArtifactSubGroup(label=entry.name, parent_dir=parent_dir)
+        with os.scandir(entry.path) as artifact_entries:
+            return subgroup, list(artifact_entries)
 
 
 class ArtifactHandler:
@@ -545,6 +666,10 @@ class ArtifactHandler:
         The name of the data artifact group. Default is "data".
     _models_group_name : str
         The name of the models artifact group. Default is "models".
+    _data_subgroup_names : Tuple[str, ...]
+        The subgroups of the data artifact group, created on first access.
+    _models_subgroup_names : Tuple[str, ...]
+        The subgroups of the models artifact group, created on first access.
     _version_handler : VersionHandler
         An instance of VersionHandler class used for managing the versions of the artifacts.
 
@@ -581,6 +706,8 @@ class ArtifactHandler:
 
     _data_group_name = "data"
     _models_group_name = "models"
+    _data_subgroup_names = ("raw", "interim", "transformed", "predicted")
+    _models_subgroup_names = ("data", "estimators", "transformers")
 
     def __init__(self, parent_dir: str):
         """
@@ -612,7 +739,7 @@ class ArtifactHandler:
         return self._version_handler.latest_version
 
     @classmethod
-    def load(cls, parent_dir: str) -> "ArtifactHandler":
+    def load(cls, parent_dir: str, lazy: bool = True) -> "ArtifactHandler":
         """
         Load an ArtifactHandler instance from the artifacts stored in the given directory.
 
@@ -620,6 +747,8 @@ class ArtifactHandler:
         ----------
         parent_dir : str
             The path of the parent directory where the artifacts are stored.
+        lazy : bool, optional
+            Whether to defer reading the content of each artifact until it is first accessed (default is True).
 
         Returns
         -------
@@ -627,23 +756,32 @@ class ArtifactHandler:
             An instance of ArtifactHandler class.
         """
         ah = cls(parent_dir=parent_dir)
-        return cls._load_from_file(ah, parent_dir)
+        return cls._load_from_file(ah, parent_dir, lazy)
 
-    def pull(self) -> "ArtifactHandler":
+    def pull(self, lazy: bool = True) -> "ArtifactHandler":
         """
         Load the latest version of the artifacts from the parent directory.
 
+        Parameters
+        ----------
+        lazy : bool, optional
+            Whether to defer reading the content of each artifact until it is first accessed (default is True).
+
         Returns
         -------
         ArtifactHandler
             An instance of ArtifactHandler class.
         """
-        return self._load_from_file(self, self.parent_dir)
+        return self._load_from_file(self, self.parent_dir, lazy)
 
     def increment_version_patch(self) -> "ArtifactHandler":
         """
         Increments the patch version of the artifact handler's version and saves the data and models artifact groups.
 
+        The files of the current version are hard-linked into the new version where the file system allows it, so
+        unchanged artifacts are not duplicated on disk. Saving an artifact replaces its files instead of writing into
+        them, which leaves the previous version untouched.
+
         Returns
         -------
         ArtifactHandler
@@ -652,12 +790,13 @@ class ArtifactHandler:
         """
         self.commit()
         old_dirname = self.version.dirname
-        release = list(self.version.release)
-        release[-1] = int(release[-1]) + 1
-        new_version_string = ".".join([str(r) for r in release])
+        release = self.version.release
+        new_version_string = ".".join(map(str, release[:-1] + (release[-1] + 1,)))
         self._version_handler.add_new_version(new_version_string)
         new_dirname = self.version.dirname
-        copy_tree(self.path, self.path.replace(old_dirname, new_dirname))
+        shutil.copytree(
+            self.path, self.path.replace(old_dirname, new_dirname), dirs_exist_ok=True, copy_function=link_or_copy
+        )
         self._update_version_handler()
         return self
 
@@ -665,24 +804,31 @@ class ArtifactHandler:
         """
         Saves the data and models artifact groups.
 
+        All artifacts of both groups are written concurrently by a single pool of up to `MAX_SAVE_WORKERS` threads.
+        The first error raised by an artifact is propagated.
+
         Returns
         -------
         ArtifactHandler
             The updated artifact handler.
 
         """
-        self.data.save()
-        self.models.save()
+        _save_all(self._iter_artifacts())
         return self
 
     @staticmethod
-    def _load_from_file(ah: "ArtifactHandler", parent_dir: str) -> "ArtifactHandler":
+    def _load_from_file(ah: "ArtifactHandler", parent_dir: str, lazy: bool) -> "ArtifactHandler":
         path = os.path.join(parent_dir, f"version={ah.version}")
         for group in [ah._data_group_name, ah._models_group_name]:
-            artifact_group = ArtifactGroup.load(label=group, parent_dir=path)
+            artifact_group = ArtifactGroup.load(label=group, parent_dir=path, lazy=lazy)
             setattr(ah, group, artifact_group)
         return ah
 
+    def _iter_artifacts(self) -> Iterable[Artifact]:
+        for group in (self.data, self.models):
+            for subgroup in group.subgroups:
+                yield from subgroup.artifacts
+
     def _update_version_handler(self):
         self._version_handler = VersionHandler(self.parent_dir)
         self._set_version()
@@ -701,21 +847,12 @@ class ArtifactHandler:
         return ArtifactGroup(
             label=self._data_group_name,
             parent_dir=self.path,
-            subgroups=[
-                ArtifactSubGroup(label="raw", parent_dir=os.path.join(self.path, self._data_group_name)),
-                ArtifactSubGroup(label="interim", parent_dir=os.path.join(self.path, self._data_group_name)),
-                ArtifactSubGroup(label="transformed", parent_dir=os.path.join(self.path, self._data_group_name)),
-                ArtifactSubGroup(label="predicted", parent_dir=os.path.join(self.path, self._data_group_name)),
-            ],
+            default_subgroups=self._data_subgroup_names,
         )
 
     def _set_models(self):
         return ArtifactGroup(
             label=self._models_group_name,
             parent_dir=self.path,
-            subgroups=[
-                ArtifactSubGroup(label="data", parent_dir=os.path.join(self.path, self._models_group_name)),
-                ArtifactSubGroup(label="estimators", parent_dir=os.path.join(self.path, self._models_group_name)),
-                ArtifactSubGroup(label="transformers", parent_dir=os.path.join(self.path, self._models_group_name)),
-            ],
+            default_subgroups=self._models_subgroup_names,
         )
@@ -1,25 +1,120 @@
 from __future__ import annotations
+import functools
 import os
-import json
-from abc import ABC, abstractmethod
-from typing import Any, Optional
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Type, Union
 
 from loguru import logger
+import numpy as np
 import pandas as pd
-from basix import files
-from pydantic.dataclasses import dataclass
 
-from mlversion._utils import get_dataframe_representation, save_bin, load_bin, get_dirname
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pacsv = None
+    pq = None
+
+from mlversion._utils import (
+    DATACLASS_OPTIONS,
+    atomic_path,
+    check_mmap_mode,
+    get_dataframe_representation,
+    load_bin,
+    load_json,
+    save_bin,
+    save_json,
+)
 from mlversion.errors import IncompatibleArtifactTypeError
 
 
-@dataclass
-class Artifact(ABC, object):
+CSV_CHUNKSIZE = 100_000
+CSV_BLOCK_SIZE = 8 << 20
+CSV_BUFFER_SIZE = 4 << 20
+PARQUET_BATCH_SIZE = 500_000
+BINARY_COMPRESSION = os.environ.get("MLVERSION_BINARY_COMPRESSION") or None
+METADATA_CACHE_SIZE = 1024
+
+ARTIFACT_TYPES: Dict[str, Type[Artifact]] = {}
+
+_metadata_cache: OrderedDict = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+_pending_loaders: Dict[str, weakref.WeakSet] = {}
+_pending_loaders_lock = threading.Lock()
+
+
+class _ContentLoader:
+    # Reads the content of a lazily loaded artifact the first time it is needed. Shallow copies of the artifact, like
+    # the ones made when it is added to another subgroup, share the loader and therefore a single read, just as shallow
+    # copies of an eagerly loaded artifact share its content.
+
+    # Loaders that have not read yet are tracked by the absolute path of their artifact, so their files can be read
+    # before they are overwritten or removed.
+
+    def __init__(self, load: Callable[[], Any], path: str):
+        self.path = path
+        self._load = load
+        self._lock = threading.Lock()
+        self._content = None
+        self._loaded = False
+        self._track()
+
+    def __call__(self) -> Any:
+        with self._lock:
+            if not self._loaded:
+                self._content = self._load()
+                self._loaded = True
+                self._load = None
+        self._untrack()
+        return self._content
+
+    def _track(self):
+        if not self._loaded:
+            with _pending_loaders_lock:
+                _pending_loaders.setdefault(os.path.abspath(self.path), weakref.WeakSet()).add(self)
+
+    def _untrack(self):
+        key = os.path.abspath(self.path)
+        with _pending_loaders_lock:
+            loaders = _pending_loaders.get(key)
+            if loaders is not None:
+                loaders.discard(self)
+                if not loaders:
+                    del _pending_loaders[key]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._track()
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class Artifact:
+    type: ClassVar[str]
+
     label: str
     content: Any
-    type: str
     parent_dir: str
     path: Optional[str] = None
+    _repr_cache: Optional[Tuple[Any, str]] = field(default=None, init=False, repr=False, compare=False)
+    _content_loader: Optional[_ContentLoader] = field(default=None, init=False, repr=False, compare=False)
+
+    def __init_subclass__(cls):
+        # Subclasses declaring their own `type` are registered when they are defined, so artifact types added after
+        # import (e.g. by plugins) can be loaded as well.
+        if "type" in cls.__dict__:
+            ARTIFACT_TYPES[cls.type] = cls
 
     def __post_init__(self):
         self.set_path(self.parent_dir, self.label)
@@ -28,170 +123,387 @@ class Artifact(ABC, object):
         setattr(self, "parent_dir", parent_dir)
         setattr(self, "path", os.path.join(parent_dir, label))
 
+    def __getattr__(self, name: str) -> Any:
+        # Lazily loaded artifacts have no `content` attribute until it is first accessed.
+        if name == "content":
+            loader = self._content_loader
+            if loader is not None:
+                self.content = loader()
+                return self.content
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self):
+        # The default state of a slotted object is read with getattr, which would read the content of lazily loaded
+        # artifacts. Unset fields are skipped instead.
+        state = {}
+        for f in fields(self):
+            try:
+                state[f.name] = object.__getattribute__(self, f.name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def get(self):
         return self.content
 
-    @abstractmethod
+    def _get_content_representation(self) -> str:
+        # The formatted table is cached together with the object it was built from, so reassigning `content`
+        # invalidates it.
+        cache = self._repr_cache
+        if cache is None or cache[0] is not self.content:
+            cache = (self.content, get_dataframe_representation(self.content))
+            self._repr_cache = cache
+        return cache[1]
+
     def save(self) -> Artifact:
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement 'save'.")
 
-    @abstractmethod
-    def load(self, path):
-        pass
+    @classmethod
+    def _lazy(cls, label: str, parent_dir: str, load: Callable[[], Any]) -> Artifact:
+        artifact = cls(label=label, content=None, parent_dir=parent_dir)
+        del artifact.content
+        artifact._content_loader = _ContentLoader(load, artifact.path)
+        return artifact
+
+    def _content_is_saved(self) -> bool:
+        # A lazily loaded artifact whose content was never read is identical to the files it was loaded from.
+        loader = self._content_loader
+        if loader is None or loader.path != self.path:
+            return False
+        try:
+            object.__getattribute__(self, "content")
+        except AttributeError:
+            return True
+        return False
 
-    def _save_metadata(self):
-        metadata = {"type": self.type}
+    @classmethod
+    def load(cls, label: str, parent_dir: str, lazy: bool = False, *, _metadata=None) -> Artifact:
+        # Subclasses must accept `_metadata`: `load_artifact` passes the metadata it already read to find the class,
+        # which can be handed to `_load_metadata` instead of reading the file again.
+        raise NotImplementedError(f"{cls.__name__} does not implement 'load'.")
+
+    def _save_metadata(self, **extra):
+        metadata = {"type": self.type, **extra}
         metadata_path = os.path.join(self.path, "metadata")
-        with open(metadata_path, "w") as file:
-            json.dump(metadata, file)
+        save_json(metadata, metadata_path)
 
     @classmethod
-    def _load_metadata(cls, path):
-        metadata_path = os.path.join(path, "metadata")
-
-        with open(metadata_path, "r") as file:
-            metadata = json.loads(file.read())
+    def _load_metadata(cls, path, metadata=None):
+        # `metadata` is passed when the caller already read it, e.g. `load_artifact` to find the artifact class.
+        if metadata is None:
+            metadata_path = os.path.join(path, "metadata")
+            metadata = load_json(metadata_path)
         if metadata["type"] != cls.type:
             raise IncompatibleArtifactTypeError(cls.type, metadata["type"])
         return metadata
 
 
 class CSVArtifact(Artifact):
+    __slots__ = ()
     type: str = "csv"
 
     def __init__(self, label: str, content: pd.DataFrame, parent_dir: str):
-        super().__init__(label=label, content=content, type=self.type, parent_dir=parent_dir, path=self.path)
+        super().__init__(label=label, content=content, parent_dir=parent_dir)
 
     def __repr__(self):
-        return get_dataframe_representation(self.content)
+        return self._get_content_representation()
 
     def __str__(self):
-        return get_dataframe_representation(self.content)
+        return self._get_content_representation()
 
     def save(self) -> CSVArtifact:
-        files.make_directory(self.path)
-        self._save_content()
-        self._save_metadata()
+        if self._content_is_saved():
+            return self
+        load_pending_artifacts(self.path, recursive=False)
+        os.makedirs(self.path, exist_ok=True)
+        column_types = self._save_content()
+        if column_types is None:
+            self._save_metadata()
+        else:
+            self._save_metadata(columns=column_types)
+        forget_artifacts(self.path)
         return self
 
     def _save_content(self):
+        # Returns the column types of tables written by pyarrow, which are recorded in the metadata, and None for
+        # tables written by pandas.
         content_filepath = os.path.join(self.path, "content")
         logger.debug(f"Saving csv artifact to {content_filepath}")
-        self.content.to_csv(content_filepath, index=False)
+        with atomic_path(content_filepath) as tmp_filepath:
+            if pacsv is not None and _is_numeric_frame(self.content):
+                # Tables of integers and floats are written by the multithreaded pyarrow writer. Other tables keep the
+                # pandas writer: pyarrow formats booleans, strings and dates differently, and cannot write complex
+                # numbers or half floats at all.
+                try:
+                    table = pa.Table.from_pandas(self.content, preserve_index=False)
+                    pacsv.write_csv(table, tmp_filepath, pacsv.WriteOptions(batch_size=CSV_CHUNKSIZE))
+                    return {
+                        column: "int64" if dtype.kind in "iu" else "float64"
+                        for column, dtype in self.content.dtypes.items()
+                    }
+                except pa.ArrowException:
+                    logger.debug("Falling back to the pandas csv writer")
+            with open(tmp_filepath, "w", buffering=CSV_BUFFER_SIZE, encoding="utf-8", newline="") as file:
+                self.content.to_csv(file, index=False, chunksize=CSV_CHUNKSIZE)
+        return None
 
     @classmethod
-    def load(cls, label: str, parent_dir: str):
+    def load(cls, label: str, parent_dir: str, lazy: bool = False, *, _metadata=None):
         path = os.path.join(parent_dir, label)
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"The csv table '{path}' do not exists.")
         logger.debug(f"Loading csv artifact from {path}")
-        cls._load_metadata(path)
-        content = cls._load_content(path)
-        return cls(label=label, content=content, parent_dir=parent_dir)
+        try:
+            metadata = cls._load_metadata(path, _metadata)
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f"The csv table '{path}' do not exists.") from error
+        load = functools.partial(cls._load_content, path, metadata.get("columns"))
+        if lazy:
+            return cls._lazy(label, parent_dir, load)
+        return cls(label=label, content=load(), parent_dir=parent_dir)
 
     @classmethod
-    def _load_content(cls, path):
+    def _load_content(cls, path, column_types=None):
+        # Tables written by pandas are read by pandas, whose type inference differs from pyarrow's (e.g. for date-like
+        # strings and missing strings). Tables written by pyarrow only hold the integer and float columns recorded in
+        # their metadata, which pyarrow reads with those exact types, as pandas would.
         content_path = os.path.join(path, "content")
-        return pd.read_csv(content_path)
+        if pacsv is None or column_types is None:
+            return pd.read_csv(content_path, dtype=column_types)
+        table = pacsv.read_csv(
+            content_path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                column_types={column: pa.type_for_alias(type_) for column, type_ in column_types.items()}
+            ),
+        )
+        return table.to_pandas(self_destruct=True, split_blocks=True)
 
 
 class ParquetArtifact(Artifact):
+    __slots__ = ()
     type: str = "parquet"
 
     def __init__(self, label: str, content: pd.DataFrame, parent_dir: str):
-        super().__init__(label=label, content=content, type=self.type, parent_dir=parent_dir, path=self.path)
+        super().__init__(label=label, content=content, parent_dir=parent_dir)
 
     def __repr__(self):
-        return get_dataframe_representation(self.content)
+        return self._get_content_representation()
 
     def __str__(self):
-        return get_dataframe_representation(self.content)
+        return self._get_content_representation()
 
     def save(self, *args, **kwargs) -> ParquetArtifact:
-        files.make_directory(self.path)
+        if not args and not kwargs and self._content_is_saved():
+            return self
+        load_pending_artifacts(self.path, recursive=False)
+        os.makedirs(self.path, exist_ok=True)
         self._save_content(*args, **kwargs)
         self._save_metadata()
+        forget_artifacts(self.path)
         return self
 
     def _save_content(self, *args, **kwargs):
         content_filepath = os.path.join(self.path, "content")
-        logger.debug(f"Saving csv artifact to {content_filepath}")
-        self.content.to_parquet(content_filepath, index=False, *args, **kwargs)
+        logger.debug(f"Saving parquet artifact to {content_filepath}")
+        kwargs.setdefault("engine", "pyarrow")
+        kwargs.setdefault("compression", "snappy")
+        streamable = pq is not None and not args and kwargs.keys() == {"engine", "compression"}
+        if kwargs.get("partition_cols"):
+            # Partitioned tables are written as a dataset directory, which cannot be swapped in atomically like a file.
+            self.content.to_parquet(content_filepath, *args, index=False, **kwargs)
+            return
+        with atomic_path(content_filepath) as tmp_filepath:
+            if streamable and kwargs["engine"] == "pyarrow":
+                self._write_batches(tmp_filepath, kwargs["compression"])
+            else:
+                self.content.to_parquet(tmp_filepath, *args, index=False, **kwargs)
+
+    def _write_batches(self, filepath, compression):
+        # Large tables are converted to arrow one batch of rows at a time, so the arrow copy of the data never holds
+        # more than PARQUET_BATCH_SIZE rows. Each batch is written as its own row group.
+        schema = pa.Schema.from_pandas(self.content, preserve_index=False)
+        with pq.ParquetWriter(filepath, schema, compression=compression) as writer:
+            for start in range(0, max(len(self.content), 1), PARQUET_BATCH_SIZE):
+                rows = self.content.iloc[start:start + PARQUET_BATCH_SIZE]
+                writer.write_table(pa.Table.from_pandas(rows, schema=schema, preserve_index=False))
 
     @classmethod
-    def load(cls, label: str, parent_dir: str, *args, **kwargs):
+    def load(
+        cls, label: str, parent_dir: str, lazy: bool = False, *, columns=None, filters=None, _metadata=None, **kwargs
+    ):
         path = os.path.join(parent_dir, label)
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"The csv table '{path}' do not exists.")
-        logger.debug(f"Loading csv artifact from {path}")
-        cls._load_metadata(path)
-        content = cls._load_content(path, *args, **kwargs)
+        logger.debug(f"Loading parquet artifact from {path}")
+        try:
+            cls._load_metadata(path, _metadata)
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f"The parquet table '{path}' do not exists.") from error
+        if lazy:
+            load = functools.partial(cls._load_content, path, columns=columns, filters=filters, **kwargs)
+            return cls._lazy(label, parent_dir, load)
+        content = cls._load_content(path, columns=columns, filters=filters, **kwargs)
         return cls(label=label, content=content, parent_dir=parent_dir)
 
     @classmethod
-    def _load_content(cls, path, *args, **kwargs):
+    def _load_content(cls, path, columns=None, filters=None, **kwargs):
         content_path = os.path.join(path, "content")
-        return pd.read_parquet(content_path, *args, **kwargs)
+        if pq is None or kwargs.get("engine", "pyarrow") != "pyarrow":
+            return pd.read_parquet(content_path, columns=columns, filters=filters, **kwargs)
+        kwargs.pop("engine", None)
+        kwargs.setdefault("memory_map", True)
+        table = pq.read_table(content_path, columns=columns, filters=filters, use_threads=True, **kwargs)
+        return table.to_pandas(self_destruct=True, split_blocks=True)
 
 
 class BinaryArtifact(Artifact):
+    __slots__ = ()
     type: str = "binary"
 
     def __init__(self, label: str, content: Any, parent_dir: str):
-        super().__init__(label=label, content=content, type=self.type, parent_dir=parent_dir, path=self.path)
-
-    def save(self) -> BinaryArtifact:
-        files.make_directory(self.path)
-        self._save_content()
-        self._save_metadata()
+        super().__init__(label=label, content=content, parent_dir=parent_dir)
+
+    def save(self, compression: Optional[str] = None) -> BinaryArtifact:
+        # Binaries are compressed with `compression`, or else with the `MLVERSION_BINARY_COMPRESSION` setting. The
+        # compression is recorded in the metadata, so loading does not need to know about it.
+        if compression is None and self._content_is_saved():
+            return self
+        compression = compression or BINARY_COMPRESSION
+        load_pending_artifacts(self.path, recursive=False)
+        os.makedirs(self.path, exist_ok=True)
+        self._save_content(compression)
+        if compression is None:
+            self._save_metadata()
+        else:
+            self._save_metadata(compression=compression)
+        forget_artifacts(self.path)
         return self
 
-    def _save_content(self):
+    def _save_content(self, compression=None):
         content_filepath = os.path.join(self.path, "content")
         logger.debug(f"Saving binary artifact to {content_filepath}")
-        save_bin(self.content, content_filepath)
+        with atomic_path(content_filepath) as tmp_filepath:
+            save_bin(self.content, tmp_filepath, compression)
 
     @classmethod
-    def load(cls, label: str, parent_dir: str):
+    def load(cls, label: str, parent_dir: str, lazy: bool = False, *, mmap_mode=None, _metadata=None):
+        check_mmap_mode(mmap_mode)
         path = os.path.join(parent_dir, label)
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"The binary '{path}' do not exists.")
         logger.debug(f"Loading binary artifact from {path}")
-        cls._load_metadata(path)
-        content = cls._load_content(path)
-        return cls(label=label, content=content, parent_dir=parent_dir)
+        try:
+            metadata = cls._load_metadata(path, _metadata)
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f"The binary '{path}' do not exists.") from error
+        compression = metadata.get("compression")
+        load = functools.partial(cls._load_content, path, compression, mmap_mode)
+        if lazy:
+            return cls._lazy(label, parent_dir, load)
+        return cls(label=label, content=load(), parent_dir=parent_dir)
 
     @classmethod
-    def _load_content(cls, path):
+    def _load_content(cls, path, compression=None, mmap_mode=None):
         content_path = os.path.join(path, "content")
-        return load_bin(content_path)
+        return load_bin(content_path, compression, mmap_mode)
+
+
+def _is_numeric_frame(content: Any) -> bool:
+    return (
+        isinstance(content, pd.DataFrame)
+        and content.columns.is_unique
+        and all(isinstance(column, str) for column in content.columns)
+        and all(
+            isinstance(dtype, np.dtype)
+            and (dtype.kind == "i" or dtype in (np.uint8, np.uint16, np.uint32, np.float32, np.float64))
+            for dtype in content.dtypes
+        )
+    )
 
 
 def get_artifact_classes():
-    return {cls.type: cls for cls in Artifact.__subclasses__()}
+    return dict(ARTIFACT_TYPES)
 
 
-def load_artifact(artifact_path: str):
+def load_artifact(artifact_path: Union[str, os.DirEntry], lazy: bool = False):
 
-    if not os.path.isdir(artifact_path):
-        raise NotADirectoryError("'{artifact_path}' is not a valid artifact path")
+    # Entries from os.scandir already know whether they are directories, which saves a stat call per artifact.
+    if isinstance(artifact_path, os.DirEntry):
+        is_dir = artifact_path.is_dir()
+        artifact_path = artifact_path.path
+    else:
+        is_dir = os.path.isdir(artifact_path)
 
-    parent_dir = os.path.dirname(artifact_path)
+    if not is_dir:
+        raise NotADirectoryError(f"'{artifact_path}' is not a valid artifact path")
 
-    label = get_dirname(artifact_path)
+    parent_dir, label = os.path.split(artifact_path.rstrip(os.sep) or artifact_path)
 
+    # Only the metadata is cached, keyed by the signature of its file. The content is read again on every load, so
+    # loaded artifacts never share objects that callers could modify in place.
+    key = os.path.abspath(artifact_path)
     metadata_path = os.path.join(artifact_path, "metadata")
+    signature = _get_file_signature(metadata_path)
 
-    with open(metadata_path, "r") as file:
-        metadata = json.loads(file.read())
+    metadata = _get_cached_metadata(key, signature)
+    if metadata is None:
+        metadata = load_json(metadata_path)
+        _set_cached_metadata(key, signature, metadata)
 
     artifact_type = metadata["type"]
 
     ArtifactClass = ARTIFACT_TYPES[artifact_type]
 
-    artifact = ArtifactClass.load(label, parent_dir)
-
-    return artifact
-
-
-ARTIFACT_TYPES = get_artifact_classes()
+    return ArtifactClass.load(label, parent_dir, lazy=lazy, _metadata=metadata)
+
+
+def forget_artifacts(path: str) -> None:
+    key = os.path.abspath(path)
+    prefix = os.path.join(key, "")
+    with _metadata_cache_lock:
+        for cached_path in [p for p in _metadata_cache if p == key or p.startswith(prefix)]:
+            del _metadata_cache[cached_path]
+
+
+def load_pending_artifacts(path: str, recursive: bool = True) -> None:
+    # Reads the content of every lazily loaded artifact at `path` (and, if `recursive`, below it) that was not read yet,
+    # e.g. earlier loads of an artifact being overwritten or copies moved to another subgroup, so they keep the content
+    # they were loaded from once the files are replaced or removed.
+    key = os.path.abspath(path)
+    prefix = os.path.join(key, "")
+    with _pending_loaders_lock:
+        if recursive:
+            keys = [k for k in _pending_loaders if k == key or k.startswith(prefix)]
+        else:
+            keys = [key] if key in _pending_loaders else []
+        loaders = [loader for k in keys for loader in _pending_loaders[k]]
+    for loader in loaders:
+        loader()
+
+
+def _get_file_signature(path: str) -> Optional[Tuple[int, ...]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _get_cached_metadata(key: str, signature: Optional[Tuple[int, ...]]) -> Optional[dict]:
+    if signature is None:
+        return None
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(key)
+        if cached is None or cached[0] != signature:
+            return None
+        _metadata_cache.move_to_end(key)
+        return dict(cached[1])
+
+
+def _set_cached_metadata(key: str, signature: Optional[Tuple[int, ...]], metadata: dict) -> None:
+    if signature is None or METADATA_CACHE_SIZE <= 0:
+        return
+    with _metadata_cache_lock:
+        _metadata_cache[key] = (signature, dict(metadata))
+        _metadata_cache.move_to_end(key)
+        while len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
@@ -1,29 +1,128 @@
+import io
+import json
 import os
+import shutil
+import sys
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any,  Union
+from typing import Any, Iterator, Optional, Union
 
 import joblib
 import pandas as pd
 from tabulate import tabulate
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+ZSTD_LEVEL = 3
+
+# Slotted dataclasses need Python 3.10+. Older versions fall back to regular dataclasses.
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def get_dataframe_representation(df):
     df_break = df.head(5)
     if len(df) > 5:
         index = list(df_break.index) + ["..."]
-        df_break = df_break.append(pd.Series(len(df.columns) * ['...'], index=df.columns), ignore_index=True)
+        ellipsis = pd.DataFrame([len(df.columns) * ['...']], columns=df.columns)
+        df_break = pd.concat([df_break, ellipsis], ignore_index=True)
         df_break.index = index
 
     return tabulate(df_break, headers='keys', tablefmt='psql')
 
 
-def save_bin(obj: Any, path: str) -> None:
+def save_bin(obj: Any, path: str, compression: Optional[str] = None) -> None:
     create_folder_chain(path)
-    joblib.dump(obj, path)
+    if compression is None:
+        joblib.dump(obj, path)
+        return
+    _check_compression(compression)
+    with open(path, "wb") as file, zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(file) as writer:
+        joblib.dump(obj, writer)
+
+
+def load_bin(path: str, compression: Optional[str] = None, mmap_mode: Optional[str] = None) -> Any:
+    # Numpy arrays of uncompressed binaries can be memory-mapped instead of read. Compressed binaries are always read.
+    check_mmap_mode(mmap_mode)
+    if compression is None:
+        return joblib.load(path, mmap_mode=mmap_mode)
+    _check_compression(compression)
+    with open(path, "rb") as file, zstandard.ZstdDecompressor().stream_reader(file) as reader:
+        # joblib peeks at the first bytes of the stream, which the decompressor cannot seek back to.
+        return joblib.load(io.BufferedReader(reader))
+
+
+def _check_compression(compression: str) -> None:
+    if compression != "zstd":
+        raise ValueError(f"Unsupported compression '{compression}'. The only supported compression is 'zstd'.")
+    if zstandard is None:
+        raise ImportError("The 'zstandard' package is required to read or write zstd compressed binaries.")
+
 
+def check_mmap_mode(mmap_mode: Optional[str]) -> None:
+    # Files are hard-linked between versions, so a writable mapping ("r+" or "w+") would also modify previous versions.
+    if mmap_mode not in (None, "r", "c"):
+        raise ValueError(
+            f"Unsupported mmap_mode {mmap_mode!r}. Binaries can only be mapped read-only ('r') or copy-on-write ('c')."
+        )
 
-def load_bin(path: str) -> Any:
-    return joblib.load(path)
+
+def save_json(obj: Any, path: str) -> None:
+    with atomic_path(path) as tmp_path:
+        if orjson is None:
+            with open(tmp_path, "w") as file:
+                json.dump(obj, file)
+        else:
+            with open(tmp_path, "wb") as file:
+                file.write(orjson.dumps(obj))
+
+
+def load_json(path: str) -> Any:
+    with open(path, "rb") as file:
+        data = file.read()
+    return json.loads(data) if orjson is None else orjson.loads(data)
+
+
+@contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    # Yields a temporary path to write to, which replaces `path` only once the write succeeded. Readers never observe
+    # a partially written file, and a failed write leaves the previous file untouched. Every write gets its own
+    # temporary file, so concurrent writers of the same path never write into the same file.
+    directory, name = os.path.split(path)
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            # Created like open() would create it, so the current umask applies to the published file.
+            os.close(os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            break
+        except FileExistsError:
+            continue
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    # Hard links share the file with the source, which is safe because artifact files are only ever replaced
+    # atomically and never modified in place. Falls back to copying across file systems or when links are unsupported.
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
 
 def create_folder_chain(path: Union[str, Path]) -> None:
@@ -33,10 +132,3 @@ def create_folder_chain(path: Union[str, Path]) -> None:
     else:
         parent_dir = path_obj.parent
         os.makedirs(parent_dir, exist_ok=True)
-
-
-def get_dirname(dirpath):
-    if not os.path.isdir(dirpath):
-        raise NotADirectoryError("'{dirpath}' is not a directory path")
-    path = Path(dirpath)
-    return path.parts[-1]
@@ -1,6 +1,7 @@
 import os
 import re
-from typing import List, Optional, Union
+import time
+from typing import Dict, List, Optional, Tuple, Union
 
 from basix import files
 from packaging import version as vs
@@ -78,6 +79,10 @@ class VersionHandler:
     _version_pattern = r"(\d+\.\d+\.\d+(dev|rc)?\d*)(\w*)$"
     _version_pattern_regex = re.compile(_version_pattern)
     _version_dir_pattern_regex = re.compile(r"version=" + _version_pattern)
+    _versions_cache: Dict[str, Tuple[int, List[ModelVersion]]] = {}
+    # Folders modified less than this long before a scan may still change without a visible change of modification
+    # time (file systems with coarse timestamps, e.g. FAT, HFS+ or NFS), so such scans are never trusted later.
+    _racy_mtime_window_ns = 3 * 10**9
 
     def __init__(self, path: str) -> None:
         """
@@ -92,6 +97,7 @@ class VersionHandler:
 
         self.versions: Union[None, List[str]] = None
         self.latest_version: Union[None, str] = None
+        self._versions_mtime: Optional[int] = None
         self._update()
 
     def init(self) -> None:
@@ -101,7 +107,7 @@ class VersionHandler:
 
         self.add_new_version("0.0.0dev0")
 
-        self._update()
+        self._update(force=True)
 
         return self
 
@@ -129,7 +135,21 @@ class VersionHandler:
 
         self._create_version_directory(version_string)
 
-        self._update()
+        self._register(ModelVersion(match.group(1)))
+
+    def _register(self, version: ModelVersion) -> None:
+        """
+        Add a newly created version to the version history without listing the directory again.
+
+        Parameters
+        ----------
+        version : ModelVersion
+            The version that was added to the directory.
+        """
+        self.history.append(version)
+        self._version_set.add(version.base_version)
+        if self._check_if_new_version_is_greater(self.latest_version, version):
+            self.latest_version = version
 
     def _create_version_directory(self, version_string: str) -> None:
         """
@@ -146,12 +166,13 @@ class VersionHandler:
             If the version already exists in the directory.
         """
 
-        if version_string in [version.base_version for version in self.history]:
+        if version_string in self._version_set:
             raise ExistingVersionError(
                 f"Unable to add version {version_string} because it " "already exists in the folder {self.path}."
             )
 
         files.make_directory(os.path.join(self.path, f"version={version_string}"))
+        self._versions_cache.pop(os.path.abspath(self.path), None)
 
     def _get_versions(self) -> None:
         """
@@ -160,25 +181,94 @@ class VersionHandler:
         """
 
         self.history = []
+        self._version_set = set()
 
         files.make_directory(self.path)
 
-        for subdir in os.listdir(self.path):
+        for version in self._scan_versions():
+            self.history.append(version)
+            self._version_set.add(version.base_version)
+            if self._check_if_new_version_is_greater(self.latest_version, version):
+                self.latest_version = version
+
+    def _scan_versions(self) -> List[ModelVersion]:
+        """
+        List and parse the version directories in the specified folder.
+
+        The parsed versions are cached per folder, together with the modification time of the folder, and are shared
+        by every `VersionHandler` pointing to it. Creating or removing a version directory changes that modification
+        time, so the folder is only listed again when its content changed. Scans of folders modified too recently to
+        rely on their modification time are not cached.
+
+        Returns
+        -------
+        List[ModelVersion]
+            The versions found in the folder, in directory listing order.
+
+        Raises
+        ------
+        InvalidVersion
+            If the folder contains an entry that is not a valid version directory.
+        """
+        key = os.path.abspath(self.path)
+        mtime = os.stat(key).st_mtime_ns
+        cached = self._versions_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        versions = []
+        for subdir in os.listdir(key):
             match = self._version_dir_pattern_regex.search(subdir)
             if match:
-                version_str = match.group(1)
-                version = ModelVersion(version_str)
-                self.history.append(version)
-                if self._check_if_new_version_is_greater(self.latest_version, version):
-                    self.latest_version = version
+                versions.append(ModelVersion(match.group(1)))
             else:
                 raise vs.InvalidVersion(f"'{subdir} is not a valid version.")
 
-    def _update(self) -> None:
+        if self._is_mtime_settled(mtime):
+            self._versions_cache[key] = (mtime, versions)
+        else:
+            self._versions_cache.pop(key, None)
+        return versions
+
+    @classmethod
+    def _is_mtime_settled(cls, mtime: Optional[int]) -> bool:
+        """
+        Check whether a modification time is old enough for any later change of the folder to change it.
+
+        Parameters
+        ----------
+        mtime : int or None
+            The modification time of the folder, in nanoseconds.
+
+        Returns
+        -------
+        bool
+            True if the modification time can be trusted to detect later changes, False otherwise.
+        """
+        return mtime is not None and time.time_ns() - mtime > cls._racy_mtime_window_ns
+
+    def _update(self, force: bool = False) -> None:
         """
         Update the version history and the latest existing version.
+
+        The update is skipped when the folder was not modified since the last update of this handler, unless that
+        update happened too soon after a modification to rely on the modification time of the folder.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Whether to update even if the folder seems unchanged, e.g. right after writing to it (default is False).
         """
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if not force and mtime is not None and mtime == self._versions_mtime:
+            return
+
         self._get_versions()
+        self._versions_mtime = mtime if self._is_mtime_settled(mtime) else None
 
     @staticmethod
     def _check_if_new_version_is_greater(
@@ -1,4 +1,6 @@
+import os
 import shutil
+import tempfile
 import pandas as pd
 
 import pytest
@@ -15,6 +17,23 @@ from mlversion._artifact_handler import ArtifactSubGroup, ArtifactGroup, Artifac
 sklearn.set_config(transform_output="pandas")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def workdir(tmp_path_factory):
+    # Tests write under relative "workdir/..." paths, which are resolved inside a temporary directory. It is created
+    # in memory on /dev/shm when available, and in the system temporary directory otherwise.
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        directory = tempfile.mkdtemp(prefix="mlversion-", dir=shm)
+    else:
+        directory = None
+    cwd = os.getcwd()
+    os.chdir(directory or tmp_path_factory.mktemp("mlversion"))
+    yield
+    os.chdir(cwd)
+    if directory is not None:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
 @pytest.fixture()
 def start_version_string():
     return "0.0.0"
@@ -1,8 +1,14 @@
 from loguru import logger  # noqa: F401
+import os
+import shutil
 import numpy as np
 import pandas as pd
-from mlversion._artifact_handler import ArtifactSubGroup, ArtifactGroup, ArtifactHandler
-from mlversion._artifacts import CSVArtifact, BinaryArtifact
+import pyarrow.parquet as pq
+import pytest
+from mlversion._artifact_handler import ArtifactSubGroup, ArtifactGroup, ArtifactHandler, _get_workers_setting
+from mlversion._artifacts import ARTIFACT_TYPES, Artifact, CSVArtifact, BinaryArtifact, ParquetArtifact, load_artifact
+from mlversion._utils import atomic_path
+from mlversion.errors import ExistingAttributeError
 
 
 def test_csv_artifact(csv_artifact):
@@ -78,7 +84,7 @@ def test_artifact_group(artifact_group, csv_artifact, bin_artifact):
     subgroups = sorted([s.label for s in group.subgroups])
     imported_subgroups = sorted([s.label for s in group_imported.subgroups])
 
-    assert all([(a, b) for a, b in zip(subgroups, imported_subgroups)])
+    assert subgroups == imported_subgroups
 
 
 def test_remove_subgroup_from_artifact_group(artifact_group, csv_artifact, bin_artifact):
@@ -108,3 +114,321 @@ def test_artifact_handler_pull(artifact_handler):
     new_artifact_handler = ArtifactHandler("workdir/handler").pull()
 
     assert artifact_handler.version == new_artifact_handler.version
+
+
+def test_add_existing_label_to_subgroup(artifact_subgroup, csv_artifact):
+    with pytest.raises(ExistingAttributeError):
+        artifact_subgroup.add_artifact(csv_artifact)
+
+    for label in ["save", "label", "parent_dir", "path", "artifacts"]:
+        with pytest.raises(ExistingAttributeError):
+            artifact_subgroup.create_artifact(label=label, content=csv_artifact.get(), type="csv")
+
+    for label in ["label", "subgroups", "default_subgroups"]:
+        with pytest.raises(ExistingAttributeError):
+            ArtifactGroup(label="group", parent_dir="workdir/test/").add_subgroup(
+                ArtifactSubGroup(label=label, parent_dir="workdir/test/")
+            )
+
+    with pytest.raises(ValueError):
+        artifact_subgroup.create_artifact(label="x-train", content=csv_artifact.get(), type="csv")
+
+    artifact_subgroup.add_artifact(csv_artifact, overwrite=True)
+
+    assert [a.label for a in artifact_subgroup.artifacts].count("train") == 1
+
+
+def test_add_artifact_to_two_subgroups(csv_artifact):
+    first = ArtifactSubGroup(label="first", parent_dir="workdir/test/").add_artifact(csv_artifact)
+    second = ArtifactSubGroup(label="second", parent_dir="workdir/test/").add_artifact(first.train)
+
+    assert first.train.parent_dir == first.path
+    assert second.train.parent_dir == second.path
+    assert second.train.get() is csv_artifact.get()
+
+
+def test_parquet_artifact_load_columns_and_filters():
+    df = pd.DataFrame([[0, 10], [1, 12], [2, 14]], columns=["id", "value"])
+    ParquetArtifact(label="table", content=df, parent_dir="workdir/test/parquet/").save()
+
+    loaded = ParquetArtifact.load("table", "workdir/test/parquet/", columns=["value"], filters=[("id", ">", 0)])
+
+    assert loaded.get()["value"].tolist() == [12, 14]
+    assert list(loaded.get().columns) == ["value"]
+
+
+def test_default_subgroups_are_created_on_access():
+    group = ArtifactGroup(label="data", parent_dir="workdir/test/", default_subgroups=("raw", "interim"))
+
+    assert len(group.subgroups) == 0
+    assert "raw" in dir(group)
+
+    raw = group.raw
+
+    assert raw is group.raw
+    assert raw.path == f"{group.path}/raw"
+    assert [subgroup.label for subgroup in group.subgroups] == ["raw"]
+    assert not hasattr(group, "predicted")
+
+
+def test_load_artifact_cache_follows_saves():
+    df = pd.DataFrame([[0, 10], [1, 12]], columns=["id", "value"])
+    CSVArtifact(label="cached", content=df, parent_dir="workdir/test/cache/").save()
+
+    first = load_artifact("workdir/test/cache/cached")
+    second = load_artifact("workdir/test/cache/cached")
+
+    assert first is not second
+    assert second.get() is not first.get()
+
+    first.get()["value"] = 999
+
+    assert load_artifact("workdir/test/cache/cached").get()["value"].tolist() == [10, 12]
+
+    CSVArtifact(label="cached", content=df + 1, parent_dir="workdir/test/cache/").save()
+
+    assert load_artifact("workdir/test/cache/cached").get()["value"].tolist() == [11, 13]
+
+
+def test_lazy_subgroup_load(artifact_subgroup, csv_artifact):
+    artifact_subgroup.save()
+    content_path = f"{artifact_subgroup.train.path}/content"
+    inode = os.stat(content_path).st_ino
+
+    lazy = ArtifactSubGroup.load(label="poc", parent_dir="workdir/test/")
+    eager = ArtifactSubGroup.load(label="poc", parent_dir="workdir/test/", lazy=False)
+
+    lazy.save()
+
+    assert os.stat(content_path).st_ino == inode
+    assert lazy.train.get().equals(csv_artifact.get())
+    assert eager.train.get().equals(csv_artifact.get())
+
+
+def test_load_missing_group_is_empty():
+    group = ArtifactGroup.load(label="missing", parent_dir="workdir/test/")
+    subgroup = ArtifactSubGroup.load(label="missing", parent_dir="workdir/test/")
+
+    assert len(group.subgroups) == 0
+    assert len(subgroup.artifacts) == 0
+
+
+def test_increment_version_patch_keeps_previous_version(artifact_handler):
+    artifact_handler.commit()
+    old_content_path = os.path.join(artifact_handler.path, "data", "raw", "X_train", "content")
+    old_content = pd.read_csv(old_content_path)
+
+    artifact_handler.increment_version_patch().pull()
+    new_X_train = artifact_handler.data.raw.X_train.get() + 100
+    artifact_handler.data.raw.create_artifact(label="X_train", content=new_X_train, type="csv", overwrite=True)
+    artifact_handler.commit()
+
+    assert pd.read_csv(old_content_path).equals(old_content)
+    assert artifact_handler.data.raw.X_train.get().equals(new_X_train)
+
+
+def test_add_subgroup_keeps_source_paths(artifact_subgroup):
+    group = ArtifactGroup(label="clustering", parent_dir="workdir/test/").add_subgroup(artifact_subgroup)
+
+    assert artifact_subgroup.train.parent_dir == artifact_subgroup.path
+    assert group.poc.train.parent_dir == group.poc.path
+    assert group.add_subgroup(group.poc, overwrite=True).poc is group.poc
+
+
+def test_binary_artifact_zstd_compression(bin_artifact):
+    pytest.importorskip("zstandard")
+    bin_artifact.save(compression="zstd")
+
+    loaded = BinaryArtifact.load(bin_artifact.label, bin_artifact.parent_dir)
+
+    assert loaded.get().coef_.tolist() == bin_artifact.get().coef_.tolist()
+
+
+def test_artifact_subclasses_are_registered():
+    class JSONArtifact(CSVArtifact):
+        __slots__ = ()
+        type = "json-test"
+
+    class TextArtifact(Artifact):
+        __slots__ = ()
+        type = "text-test"
+
+        def save(self):
+            os.makedirs(self.path, exist_ok=True)
+            with open(os.path.join(self.path, "content"), "w") as file:
+                file.write(self.content)
+            self._save_metadata()
+            return self
+
+        @classmethod
+        def load(cls, label, parent_dir, lazy=False, *, _metadata=None):
+            path = os.path.join(parent_dir, label)
+            cls._load_metadata(path, _metadata)
+            with open(os.path.join(path, "content")) as file:
+                return cls(label=label, content=file.read(), parent_dir=parent_dir)
+
+    try:
+        assert ARTIFACT_TYPES["json-test"] is JSONArtifact
+        assert ARTIFACT_TYPES["csv"] is CSVArtifact
+
+        TextArtifact(label="text", content="hello", parent_dir="workdir/test/plugin/").save()
+        assert load_artifact("workdir/test/plugin/text").get() == "hello"
+    finally:
+        ARTIFACT_TYPES.pop("text-test")
+        ARTIFACT_TYPES.pop("json-test")
+
+
+def test_csv_artifact_round_trip():
+    numeric = pd.DataFrame({"id": [0, 1, 2], "value": [0.1, np.nan, 1e-5]})
+    mixed = numeric.assign(name=["a", "b, c", None])
+
+    for label, df in [("numeric", numeric), ("mixed", mixed)]:
+        CSVArtifact(label=label, content=df, parent_dir="workdir/test/csv/").save()
+        assert CSVArtifact.load(label, "workdir/test/csv/").get().equals(df)
+
+
+def test_csv_artifact_loads_like_pandas(tmp_path):
+    tables = {
+        "strings": pd.DataFrame({"date": ["2020-01-01", "2020-01-02"], "name": ["a", None]}),
+        "numbers": pd.DataFrame({"whole": [1.0, 2.0], "empty": [np.nan, np.nan], "small": np.array([1, 2], "int8")}),
+    }
+
+    for label, df in tables.items():
+        CSVArtifact(label=label, content=df, parent_dir="workdir/test/csv/").save()
+        df.to_csv(tmp_path / label, index=False)
+
+        loaded = CSVArtifact.load(label, "workdir/test/csv/").get()
+
+        pd.testing.assert_frame_equal(loaded, pd.read_csv(tmp_path / label))
+
+
+def test_csv_artifact_keeps_pandas_formatting():
+    df = pd.DataFrame(
+        {
+            "flag": [True, False],
+            "complex": np.array([1 + 2j, 3 - 1j]),
+            "half": np.array([0.5, 1.5], dtype="float16"),
+        }
+    )
+
+    CSVArtifact(label="formatting", content=df, parent_dir="workdir/test/csv/").save()
+
+    with open("workdir/test/csv/formatting/content") as file:
+        assert file.read() == df.to_csv(index=False)
+
+
+def test_binary_artifact_mmap_load():
+    array = np.arange(100_000, dtype="float64")
+    BinaryArtifact(label="array", content=array, parent_dir="workdir/test/bin/").save()
+
+    loaded = BinaryArtifact.load("array", "workdir/test/bin/", mmap_mode="r")
+
+    assert isinstance(loaded.get(), np.memmap)
+    assert np.array_equal(loaded.get(), array)
+
+    for mmap_mode in ["r+", "w+"]:
+        with pytest.raises(ValueError):
+            BinaryArtifact.load("array", "workdir/test/bin/", mmap_mode=mmap_mode)
+
+
+def test_parquet_artifact_is_written_in_batches(monkeypatch):
+    monkeypatch.setattr("mlversion._artifacts.PARQUET_BATCH_SIZE", 2)
+    df = pd.DataFrame({"id": range(5), "name": ["a", None, "c", "d", "e"]})
+    ParquetArtifact(label="batches", content=df, parent_dir="workdir/test/parquet/").save()
+
+    loaded = ParquetArtifact.load("batches", "workdir/test/parquet/")
+
+    assert loaded.get().equals(df)
+    assert pq.ParquetFile("workdir/test/parquet/batches/content").num_row_groups == 3
+
+
+def test_save_after_directory_was_removed(csv_artifact):
+    subgroup = ArtifactSubGroup(label="removed", parent_dir="workdir/test/").add_artifact(csv_artifact).save()
+
+    shutil.rmtree(subgroup.path)
+    subgroup.save()
+
+    assert os.path.exists(f"{subgroup.path}/train/content")
+
+
+def test_move_lazy_artifact_between_subgroups(csv_artifact):
+    ArtifactSubGroup(label="source", parent_dir="workdir/test/move/").add_artifact(csv_artifact).save()
+    source = ArtifactSubGroup.load(label="source", parent_dir="workdir/test/move/")
+    destination = ArtifactSubGroup(label="destination", parent_dir="workdir/test/move/")
+
+    destination.add_artifact(source.train)
+    source.remove_artifact("train")
+    destination.save()
+
+    assert not os.path.exists("workdir/test/move/source/train")
+    assert CSVArtifact.load("train", "workdir/test/move/destination").get().equals(csv_artifact.get())
+
+
+def test_atomic_path_uses_a_temporary_file_per_writer(tmp_path):
+    path = str(tmp_path / "content")
+
+    with atomic_path(path) as first, atomic_path(path) as second:
+        assert first != second
+        for tmp_filepath, text in [(first, "first"), (second, "second")]:
+            with open(tmp_filepath, "w") as file:
+                file.write(text)
+
+    with open(path) as file:
+        assert file.read() == "first"
+    assert os.listdir(tmp_path) == ["content"]
+
+
+def test_workers_setting(monkeypatch):
+    monkeypatch.delenv("MLVERSION_LOAD_WORKERS", raising=False)
+    assert _get_workers_setting("MLVERSION_LOAD_WORKERS", 8) == 8
+
+    monkeypatch.setenv("MLVERSION_LOAD_WORKERS", "0")
+    assert _get_workers_setting("MLVERSION_LOAD_WORKERS", 8) == 1
+
+    monkeypatch.setenv("MLVERSION_LOAD_WORKERS", "many")
+    with pytest.raises(ValueError, match="MLVERSION_LOAD_WORKERS"):
+        _get_workers_setting("MLVERSION_LOAD_WORKERS", 8)
+
+
+def test_lazy_artifacts_keep_their_content_when_overwritten(csv_artifact):
+    ArtifactSubGroup(label="source", parent_dir="workdir/test/overwrite/").add_artifact(csv_artifact).save()
+    loaded = ArtifactSubGroup.load(label="source", parent_dir="workdir/test/overwrite/")
+    old = loaded.train
+    moved = ArtifactSubGroup(label="destination", parent_dir="workdir/test/overwrite/").add_artifact(loaded.train)
+
+    new = csv_artifact.get() + 100
+    loaded.create_artifact(label="train", content=new, type="csv", overwrite=True).save()
+    moved.save()
+
+    assert old.get().equals(csv_artifact.get())
+    assert CSVArtifact.load("train", "workdir/test/overwrite/destination").get().equals(csv_artifact.get())
+    assert CSVArtifact.load("train", "workdir/test/overwrite/source").get().equals(new)
+
+
+def test_subgroup_equality(csv_artifact):
+    assert ArtifactSubGroup(label="s", parent_dir="w") == ArtifactSubGroup(label="s", parent_dir="w")
+    assert ArtifactSubGroup(label="s", parent_dir="w").add_artifact(csv_artifact) == ArtifactSubGroup(
+        label="s", parent_dir="w"
+    ).add_artifact(csv_artifact)
+    assert ArtifactSubGroup(label="s", parent_dir="w").add_artifact(csv_artifact) != ArtifactSubGroup(
+        label="s", parent_dir="w"
+    )
+    assert "dict_values" not in repr(ArtifactSubGroup(label="s", parent_dir="w"))
+
+
+def test_group_equality(artifact_subgroup):
+    assert ArtifactGroup(label="g", parent_dir="w") == ArtifactGroup(label="g", parent_dir="w")
+    assert ArtifactGroup(label="g", parent_dir="w").add_subgroup(artifact_subgroup) != ArtifactGroup(
+        label="g", parent_dir="w"
+    )
+    assert "dict_values" not in repr(ArtifactGroup(label="g", parent_dir="w"))
+
+
+def test_parquet_artifact_partitioned_save():
+    df = pd.DataFrame({"id": [0, 1, 2], "group": ["a", "b", "a"]})
+    ParquetArtifact(label="partitioned", content=df, parent_dir="workdir/test/parquet/").save(partition_cols=["group"])
+
+    loaded = ParquetArtifact.load("partitioned", "workdir/test/parquet/").get()
+
+    assert os.path.isdir("workdir/test/parquet/partitioned/content")
+    assert sorted(zip(loaded["id"], loaded["group"].astype(str))) == [(0, "a"), (1, "b"), (2, "a")]
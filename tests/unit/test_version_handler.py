@@ -73,3 +73,51 @@ def test_check_if_new_version_is_greater(version_handler: VersionHandler):
     assert not version_handler._check_if_new_version_is_greater("1.0.0", None)
     with pytest.raises(TypeError):
         version_handler._check_if_new_version_is_greater(None, None)
+
+
+def test_version_handler_sees_versions_added_by_another_handler(models_path: str):
+    first = VersionHandler(models_path)
+    second = VersionHandler(models_path)
+
+    first.add_new_version("0.0.3")
+    second._update()
+
+    assert "0.0.3" in [version.base_version for version in second.history]
+
+
+def test_version_handler_registers_added_versions(models_path: str):
+    version_handler = VersionHandler(os.path.join(models_path, "registered"))
+
+    version_handler.add_new_version("0.1.0")
+    version_handler.add_new_version("0.2.0")
+
+    assert version_handler.latest_version == vs.Version("0.2.0")
+    assert [version.base_version for version in version_handler.history] == ["0.1.0", "0.2.0"]
+    with pytest.raises(ExistingVersionError):
+        version_handler.add_new_version("0.1.0")
+
+
+def test_version_handler_does_not_trust_recent_modification_times(models_path: str):
+    path = os.path.join(models_path, "racy")
+    VersionHandler(path).add_new_version("0.0.1")
+    mtime = os.stat(path).st_mtime_ns
+    VersionHandler(path)
+
+    os.mkdir(os.path.join(path, "version=0.0.2"))
+    os.utime(path, ns=(mtime, mtime))
+
+    assert VersionHandler(path).latest_version == vs.Version("0.0.2")
+
+
+def test_version_handler_update_does_not_trust_recent_modification_times(models_path: str):
+    path = os.path.join(models_path, "racy_update")
+    version_handler = VersionHandler(path)
+    version_handler.add_new_version("0.0.1")
+    version_handler._update()
+    mtime = os.stat(path).st_mtime_ns
+
+    os.mkdir(os.path.join(path, "version=0.0.2"))
+    os.utime(path, ns=(mtime, mtime))
+    version_handler._update()
+
+    assert version_handler.latest_version == vs.Version("0.0.2")